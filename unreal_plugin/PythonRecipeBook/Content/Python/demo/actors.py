@@ -7,18 +7,22 @@ in our current 3D level
 
 import unreal
 
-from .unreal_systems import (
-    EditorAssetLibrary,
-    EditorActorSubsystem
-)
+from . import unreal_systems
+
 
 function_demo_class = None
-def is_functions_demo_actor(actor):
+
+# module cache of whether each class is a child of the functions demo class,
+# keyed by class path so the cache doesn't keep the classes themselves alive
+demo_class_cache = {}
+
+def is_functions_demo_actor(actor, cls=None):
     """
     check if the given actor is a 'ue_functions_demo' blueprint actor
 
     parameters:
         actor: the actor to process
+        cls: the actor's class, if already known
 
     return:
         True if the actor is an ue_functions_demo BP
@@ -27,13 +31,26 @@ def is_functions_demo_actor(actor):
 
     if not function_demo_class:
         asset_path = "/PythonRecipeBook/sample_assets/ue_functions_demo"
-        if EditorAssetLibrary.does_asset_exist(asset_path):
-            function_demo_class = EditorAssetLibrary.load_asset(asset_path).generated_class()
+        if unreal_systems.EditorAssetLibrary.does_asset_exist(asset_path):
+            function_demo_class = unreal_systems.EditorAssetLibrary.load_asset(asset_path).generated_class()
+
+            # any cached results were checked against a previous demo class
+            demo_class_cache.clear()
         else:
             unreal.log_warning(f"functions_demo asset not found in its expected location: {asset_path}")
             return
 
-    return unreal.MathLibrary.class_is_child_of(actor.get_class(), function_demo_class)
+    if cls is None:
+        cls = actor.get_class()
+
+    # the result only depends on the class, so each class only needs to be checked once
+    class_path = cls.get_path_name()
+    is_demo_class = demo_class_cache.get(class_path)
+    if is_demo_class is None:
+        is_demo_class = unreal.MathLibrary.class_is_child_of(cls, function_demo_class)
+        demo_class_cache[class_path] = is_demo_class
+
+    return is_demo_class
 
 
 def get_scene_hierarchy():
@@ -44,81 +61,113 @@ def get_scene_hierarchy():
         the scene's actor hierarchy in a json compliant dict
     """
 
-    # get all top level actors
-    top_level_actors = [
-        actor
-        for actor in EditorActorSubsystem.get_all_level_actors()
-        if not actor.get_attach_parent_actor()
-        and not actor.get_parent_actor()
-    ]
-
     # get the hierarchy for each top level actor
     data = {
         str(actor.get_path_name()): walk_actor(actor)
-        for actor in top_level_actors
+        for actor in get_root_actors()
     }
 
     return data
 
 
-def walk_actor(actor):
+def get_root_actors():
     """
-    walk the given actor's hierarchy and convert it to a json compliant dict
-
-    parameters:
-        actor: the actor to process
+    get the top level actors of the 3D level,
+    these are actors that are neither attached to nor spawned by another actor
 
     return:
-        dict: the actor's hierarchy in a json compliant dict
+        list: the top level actors
     """
-    # Get the asset path
-    asset_path = get_asset_from_actor(actor)
+    level_actors = unreal_systems.EditorActorSubsystem.get_all_level_actors()
 
-    # separate the nested actors from the spawned actors:
-    spawned_actors = actor.get_all_child_actors()
-    nested_actors = [
-        child
-        for child in actor.get_attached_actors()  # all actors under the current actor
-        if child not in spawned_actors  # actors spawned by the current actor
-    ]
+    # collect every actor that's nested under or spawned by another actor
+    child_actors = set()
+    for actor in level_actors:
+        child_actors.update(actor.get_attached_actors())
+        child_actors.update(actor.get_all_child_actors())
 
-    if spawned_actors:
-        print(f"{actor.get_actor_label()} spawns the following actors:")
-        for child in spawned_actors:
-            print(f"\t> {child.get_actor_label()}")
+    return [
+        actor
+        for actor in level_actors
+        if actor not in child_actors
+    ]
 
-    # Recurse through any nested actors
-    children = {
-        str(child.get_path_name()): walk_actor(child)
-        for child in nested_actors
-    }
 
-    # Store the actor data
-    data = {
-        "display_name": str(actor.get_actor_label()),
-        "actor_class": str(actor.get_class().get_name()),
-        "asset_path": str(asset_path),
-        "transform": get_actor_root_transform(actor),
-        "children": children
-    }
+def walk_actor(actor):
+    """
+    walk the given actor's hierarchy and convert it to a json compliant dict
 
-    # if we know the class we're interacting with we can use `call_method`
-    # to run functions declared in the Blueprint Graph
-    if is_functions_demo_actor(actor):
-        data["arbitrary_data"] = str(actor.call_method("get_arbitrary_data"))
-        data["prefixed_data"] = str(actor.call_method("add_prefix", ("my_input",)))
+    parameters:
+        actor: the actor to process
 
-        print(
-            f"Processed the following additional data on {data['display_name']}:\n\t"
-            f"arbitrary_data: {data['arbitrary_data']}\n\t"
-            f"prefixed_data : {data['prefixed_data']}"
-        )
+    return:
+        dict: the actor's hierarchy in a json compliant dict
+    """
+    # walk the hierarchy with a stack instead of recursion,
+    # each entry is an actor and the parent's "children" dict to store it in
+    root_data = None
+    stack = [(actor, None)]
+    while stack:
+        actor, parent_children = stack.pop()
+
+        # Query the actor's class & label once, each call crosses into c++
+        cls = actor.get_class()
+        label = actor.get_actor_label()
+
+        # Get the asset path
+        asset_path = get_asset_from_actor(actor, cls)
+
+        # separate the nested actors from the spawned actors:
+        # unreal.Object hashes by its UObject, a set gives us constant time lookups
+        spawned_actors = actor.get_all_child_actors()
+        spawned_set = set(spawned_actors)
+        nested_actors = [
+            child
+            for child in actor.get_attached_actors()  # all actors under the current actor
+            if child not in spawned_set  # actors spawned by the current actor
+        ]
+
+        if spawned_actors:
+            print(f"{label} spawns the following actors:")
+            for child in spawned_actors:
+                print(f"\t> {child.get_actor_label()}")
+
+        # Store the actor data
+        # the label, class name, and asset path are already python strings
+        data = {
+            "display_name": label,
+            "actor_class": cls.get_name(),
+            "asset_path": asset_path,
+            "transform": get_actor_root_transform(actor),
+            "children": {}
+        }
+
+        # if we know the class we're interacting with we can use `call_method`
+        # to run functions declared in the Blueprint Graph
+        if is_functions_demo_actor(actor, cls):
+            data["arbitrary_data"] = str(actor.call_method("get_arbitrary_data"))
+            data["prefixed_data"] = str(actor.call_method("add_prefix", ("my_input",)))
+
+            print(
+                f"Processed the following additional data on {data['display_name']}:\n\t"
+                f"arbitrary_data: {data['arbitrary_data']}\n\t"
+                f"prefixed_data : {data['prefixed_data']}"
+            )
+
+        # print out the component hierarchy of this actor
+        print(f"{label} components:")
+        walk_component(actor.root_component, actor)
+
+        # add this actor to its parent, the children dict is filled in by reference
+        if parent_children is None:
+            root_data = data
+        else:
+            parent_children[actor.get_path_name()] = data
 
-    # print out the component hierarchy of this actor
-    print(f"{actor.get_actor_label()} components:")
-    walk_component(actor.root_component, actor)
+        # queue any nested actors, reversed so they're processed in their original order
+        stack.extend((child, data["children"]) for child in reversed(nested_actors))
 
-    return data
+    return root_data
 
 
 def walk_component(component, owner=None, indent=2):
@@ -132,12 +181,15 @@ def walk_component(component, owner=None, indent=2):
                if provided this will keep the results
                local to the immediate actor
     """
-    if component and (component.get_owner() == owner or not owner):
-        print(f"{'. '*indent}{component.get_name()}")
+    stack = [(component, indent)]
+    while stack:
+        component, indent = stack.pop()
+        if component and (component.get_owner() == owner or not owner):
+            print(f"{'. '*indent}{component.get_name()}")
 
-        # recurse through any immediate children
-        for child in component.get_children_components(False):
-            walk_component(child, owner, indent+2)
+            # queue any immediate children, reversed to print them in their original order
+            children = component.get_children_components(False)
+            stack.extend((child, indent+2) for child in reversed(children))
 
 
 def get_actor_root_transform(actor):
@@ -162,44 +214,94 @@ def get_actor_root_transform(actor):
     rotate = xform.rotation.rotator()
     scale = xform.scale3d
 
+    # vector & rotator components are already Python floats
     return {
-        "location": [float(v) for v in [translate.x, translate.y, translate.z]],
-        "rotate": [float(v) for v in [rotate.roll, rotate.pitch, rotate.yaw]],
-        "scale": [float(v) for v in [scale.x, scale.y, scale.z]],
+        "location": [translate.x, translate.y, translate.z],
+        "rotate": [rotate.roll, rotate.pitch, rotate.yaw],
+        "scale": [scale.x, scale.y, scale.z],
         "is_absolute": [root.absolute_location, root.absolute_rotation, root.absolute_scale]
     }
 
 
-def get_asset_from_actor(actor):
+# module cache of the asset resolver function to use for each actor class,
+# keyed by class path so the cache doesn't keep the classes themselves alive
+asset_resolver_cache = {}
+
+def get_asset_from_actor(actor, cls=None):
     """
     Get the content browser asset path of the given actor,
     support must be added for each asset type
 
     parameters:
         actor: the actor to process
+        cls: the actor's class, if already known
 
     returns:
         the actor's source asset (if supported & found)
     """
+    if cls is None:
+        cls = actor.get_class()
+
+    # how we find the asset only depends on the actor's class,
+    # so we only need to work out which resolver to use once per class
+    class_path = cls.get_path_name()
+    resolver = asset_resolver_cache.get(class_path)
+    if resolver is None:
+        resolver = get_asset_resolver(actor, cls)
+        asset_resolver_cache[class_path] = resolver
+
+    return resolver(actor, cls)
+
+
+def get_asset_resolver(actor, cls):
+    """
+    Get the function that finds the source asset for actors of the given class,
+    support must be added for each asset type
+
+    parameters:
+        actor: an actor of the class to process
+        cls: the actor's class
+
+    returns:
+        a function taking (actor, cls) and returning the actor's asset path
+    """
 
     # the source asset is usually stored on the root component
     # and is generally unique per component class type,
     # support will need to be added for each type
-    if isinstance(actor.get_class(), unreal.BlueprintGeneratedClass):
-        asset = actor.get_class().get_outer()
+    if isinstance(cls, unreal.BlueprintGeneratedClass):
+        return get_blueprint_asset
     elif isinstance(actor, unreal.StaticMeshActor):
-        asset = actor.static_mesh_component.static_mesh.get_outer()
+        return get_static_mesh_asset
     elif isinstance(actor, unreal.SkeletalMeshActor):
-        asset = actor.skeletal_mesh_component.skeletal_mesh.get_outer()
+        return get_skeletal_mesh_asset
     else:
-        unreal.log_warning(
-            f"\n\tActor {actor.get_actor_label()} has an unknown or unsupported source asset ({actor.get_class()})"
-            "\n\t\tEither the actor does not have a source asset in the Content Browser"
-            "\n\t\tor get_asset_from_actor() does not yet support its class type"
-        )
-        return ""
-
-    return str(asset.get_path_name())
+        return get_unsupported_asset
+
+
+def get_blueprint_asset(actor, cls):
+    """asset resolver for blueprint actors, the generated class is owned by the blueprint asset"""
+    return str(cls.get_outer().get_path_name())
+
+
+def get_static_mesh_asset(actor, cls):
+    """asset resolver for static mesh actors"""
+    return str(actor.static_mesh_component.static_mesh.get_outer().get_path_name())
+
+
+def get_skeletal_mesh_asset(actor, cls):
+    """asset resolver for skeletal mesh actors"""
+    return str(actor.skeletal_mesh_component.skeletal_mesh.get_outer().get_path_name())
+
+
+def get_unsupported_asset(actor, cls):
+    """asset resolver for unsupported actors, warns the user and returns an empty path"""
+    unreal.log_warning(
+        f"\n\tActor {actor.get_actor_label()} has an unknown or unsupported source asset ({cls})"
+        "\n\t\tEither the actor does not have a source asset in the Content Browser"
+        "\n\t\tor get_asset_from_actor() does not yet support its class type"
+    )
+    return ""
 
 
 def enable_selection_tracking():
@@ -10,7 +10,6 @@ on exposing most of the available practical options in individual examples
 """
 
 
-import json
 import os
 from pathlib import Path
 
@@ -23,6 +22,36 @@ from . import (
 )
 
 
+# module cache of the values filter_item_data() compares against, stored per item
+# this lets us filter the items without querying their editor properties every time
+#
+# NOTE: unreal.Object wrappers hash & compare by their UObject, so the wrappers Blueprint
+#       passes back to filter_item_data() still find their entry. The cache is cleared each time
+#       get_item_data_for_euw() rebuilds the items, so only the latest item list is kept alive
+item_filter_cache = {}
+
+
+def get_item_filter_data(item):
+    """
+    Get the (type, group, lowercase name) values used to filter the given item data
+
+    parameters:
+        item: the meta_item_data entry to process
+
+    Return:
+        a tuple of the item's type, group, and lowercase name as strings
+    """
+    filter_data = item_filter_cache.get(item)
+    if filter_data is None:
+        # the item wasn't created by get_item_data_for_euw(), get its data from unreal
+        filter_data = (
+            str(item.get_editor_property("type")),
+            str(item.get_editor_property("group")),
+            str(item.get_editor_property("name")).lower()
+        )
+    return filter_data
+
+
 @unreal.uclass()
 class PyDemoBPLibrary(unreal.BlueprintFunctionLibrary):
     """
@@ -138,35 +167,62 @@ class PyDemoBPLibrary(unreal.BlueprintFunctionLibrary):
         # The template asset path for our item data
         item_template_path = "/PythonRecipeBook/sample_tools/widgets/meta_item_data"
 
-        # use arbitrary icons from the icons python dir
+        # get all of our managed assets (using the default arg for "is_managed_asset")
+        assets = metadata.find_assets_by_metadata(class_names=["Blueprint"])
+        if not assets:
+            return []
+
+        # get the metadata we need from each asset in a single pass
+        asset_metadata = metadata.get_metadata_bulk(
+            assets,
+            [
+                metadata.META_ASSET_NAME,
+                metadata.META_ASSET_TYPE,
+                metadata.META_ASSET_GROUP,
+                metadata.META_ASSET_VERSION
+            ]
+        )
+        asset_metadata = [asset_metadata[str(asset.package_name)] for asset in assets]
+
+        # use arbitrary icons from the icons python dir,
+        # only the icons matching the last letter of an asset name are needed
+        needed_icons = {
+            meta[metadata.META_ASSET_NAME][-1]
+            for meta in asset_metadata
+            if meta[metadata.META_ASSET_NAME]
+        }
         fp = Path(__file__).parent
         icon_dir = fp.joinpath("icons")
         icons = {
             icon.stem: str(icon)
             for icon in icon_dir.iterdir()
+            if icon.stem in needed_icons
         }
 
-        # get all of our managed assets (using the default arg for "is_managed_asset")
-        assets = metadata.find_assets_by_metadata(class_names=["Blueprint"])
-        if not assets:
-            return []
+        # these items replace any previously created item data
+        item_filter_cache.clear()
 
         items = []
-        for asset in assets:
+        for meta in asset_metadata:
             # Create a new Python instance of the template asset
             item = utils.new_instance_from_asset(item_template_path)
-            name = metadata.get_metadata(asset, metadata.META_ASSET_NAME)
 
             # feed the desired asset metadata into our item
+            name = meta[metadata.META_ASSET_NAME]
+            asset_type = meta[metadata.META_ASSET_TYPE]
+            asset_group = meta[metadata.META_ASSET_GROUP]
             item.set_editor_properties({
                 "name": name,
-                "type": metadata.get_metadata(asset, metadata.META_ASSET_TYPE),
-                "group": metadata.get_metadata(asset, metadata.META_ASSET_GROUP),
-                "version": metadata.get_metadata(asset, metadata.META_ASSET_VERSION),
+                "type": asset_type,
+                "group": asset_group,
+                "version": meta[metadata.META_ASSET_VERSION],
                 "image_path": icons.get(name[-1])
             })
             items.append(item)
 
+            # cache the values we'll filter this item by
+            item_filter_cache[item] = (str(asset_type), str(asset_group), str(name).lower())
+
         # return the list of ready-to-use item data in our EUW!
         return items
 
@@ -183,12 +239,16 @@ class PyDemoBPLibrary(unreal.BlueprintFunctionLibrary):
         # only use the filter if it's valid, otherwise skip it (return True)
         def check_filter_match(a, b): return str(a) == str(b) if a else True
 
+        # lowercase the name filter once rather than once per item
+        name_filter = name_filter.lower() if name_filter else ""
+
+        # pair each item with its cached filter data so we only compare Python strings
         return [
             item
-            for item in items
-            if check_filter_match(type_filter, item.get_editor_property("type"))
-            and check_filter_match(group_filter, item.get_editor_property("group"))
-            and name_filter.lower() in str(item.get_editor_property("name")).lower()
+            for item, (item_type, item_group, item_name) in zip(items, map(get_item_filter_data, items))
+            if check_filter_match(type_filter, item_type)
+            and check_filter_match(group_filter, item_group)
+            and name_filter in item_name
         ]
 
 
@@ -206,17 +266,12 @@ class PyDemoBPLibrary(unreal.BlueprintFunctionLibrary):
         }
 
         # we'll save this file to the users' tmp dir under 'unreal/unreal_prefs_<pref>.json'
-        prefs_file = Path(
-            unreal.Paths.project_saved_dir(),
-            "pytemp",
-            f"unreal_prefs_{prefs_name}.json"
-        )
+        prefs_file = utils.get_pytemp_dir() / f"unreal_prefs_{prefs_name}.json"
 
         if not prefs_file.exists():
             prefs_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with prefs_file.open("w", encoding="utf-8") as f:
-            json.dump(prefs, f, indent=2)
+        utils.save_json(prefs_file, prefs)
 
 
     @unreal.ufunction(
@@ -227,16 +282,12 @@ class PyDemoBPLibrary(unreal.BlueprintFunctionLibrary):
         """Python Blueprint Node -- load some basic prefs data"""
 
         # use the same path structure as the save and make sure it exists
-        prefs_file = Path(
-            unreal.Paths.project_saved_dir(),
-            "pytemp",
-            f"unreal_prefs_{prefs_name}.json"
-        )
+        prefs_file = utils.get_pytemp_dir() / f"unreal_prefs_{prefs_name}.json"
         if not prefs_file.exists():
             return {}
 
         # we can return the dict as-is, Unreal will convert it to a Map(str,str) for us
-        return json.loads(prefs_file.read_text())
+        return utils.load_json(prefs_file)
 
 
     @unreal.ufunction(
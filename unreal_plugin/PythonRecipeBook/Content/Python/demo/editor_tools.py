@@ -16,18 +16,32 @@ Effectively, we're telling Unreal to ignore specified Editor Tools and managing
 during Editor shutdown / startup to ensure Python is fully initialized before they're opened.
 """
 
-import json
-from pathlib import Path
+from functools import partial
 
-from .unreal_systems import (
-    EditorAssetLibrary,
-    EditorUtilitySubsystem
+from . import (
+    unreal_systems,
+    utils
 )
 
 import unreal
 
+
+class ToolCacheEntry:
+    """
+    Tracking data for a recently closed tool
+
+    __slots__ keeps these entries lightweight, they're updated on every Slate tick
+    """
+    __slots__ = ("callback_id", "time")
+
+    def __init__(self, callback_id=None):
+        self.callback_id = callback_id
+        self.time = 0.0
+
+
 # module cache to track recently closed tools
 cache_delayed_editor_tool_shutdown = {}
+editor_tool_cache_path = None
 
 
 def on_editor_tool_close(tool_path):
@@ -50,12 +64,11 @@ def on_editor_tool_close(tool_path):
 
     # create & cache a callback that will track this tool for the next 2 seconds
     # by default the register_slate_post_tick_callback function only passes
-    # the delta time to our declared function, by using a lambda
+    # the delta time to our declared function, by binding the tool path with partial
     # we can also have the callback track which blueprint path it's associated with
-    cache_delayed_editor_tool_shutdown.setdefault(tool_path, {}).setdefault(
-        "callback_id",
+    cache_delayed_editor_tool_shutdown[tool_path] = ToolCacheEntry(
         unreal.register_slate_post_tick_callback(
-            lambda x: cache_tracker_callback(tool_path, x)
+            partial(cache_tracker_callback, tool_path)
         )
     )
     print(f"[editor_tool] Begin tracking {tool_path}...")
@@ -68,16 +81,16 @@ def cache_tracker_callback(tool_path, delay):
     global cache_delayed_editor_tool_shutdown
 
     # update the counter tracking how much time has passed since the tool was closed
-    counter = cache_delayed_editor_tool_shutdown.setdefault(tool_path, {}).setdefault("time", 0.0)
-    counter += delay
-    cache_delayed_editor_tool_shutdown[tool_path]["time"] = counter
+    entry = cache_delayed_editor_tool_shutdown.get(tool_path)
+    if entry is None:
+        return
+    entry.time += delay
 
     # if more than 2 seconds has passed we can remove the tool from the cache
     # unregister the callback and then remove the cache entry
-    if counter > 2:
-        cid = cache_delayed_editor_tool_shutdown[tool_path].get("callback_id")
-        if cid:
-            unreal.unregister_slate_post_tick_callback(cid)
+    if entry.time > 2:
+        if entry.callback_id:
+            unreal.unregister_slate_post_tick_callback(entry.callback_id)
         del cache_delayed_editor_tool_shutdown[tool_path]
         print(f"[editor_tool] No longer tracking {tool_path}")
 
@@ -87,11 +100,12 @@ def get_cache_path():
     The file location for the editor tool cache (json file)
     it should resolve to "{project dir}/Saved/pytemp/editor_tool_cache.json"
     """
-    return Path(
-        unreal.Paths.project_saved_dir(),
-        "pytemp",
-        "editor_tool_cache.json"
-    )
+    global editor_tool_cache_path
+
+    if editor_tool_cache_path is None:
+        editor_tool_cache_path = utils.get_pytemp_dir() / "editor_tool_cache.json"
+
+    return editor_tool_cache_path
 
 def shutdown():
     """
@@ -109,8 +123,7 @@ def shutdown():
     cache_file = get_cache_path()
     
     # save the cache information to the json file
-    with cache_file.open("w", encoding="utf-8") as f:
-        json.dump({"tools_to_open": opened_tools}, f, indent=2)
+    utils.save_json(cache_file, {"tools_to_open": opened_tools})
 
 
 def startup():
@@ -122,11 +135,11 @@ def startup():
         return
 
     # loop through and launch our tools
-    data = json.loads(cache_file.read_text())
+    data = utils.load_json(cache_file)
     for tool in data.get("tools_to_open", []):
         print(f"Opening cached editor tool: {tool}")
-        asset = EditorAssetLibrary.load_asset(tool)
-        EditorUtilitySubsystem.spawn_and_register_tab(asset)
+        asset = unreal_systems.EditorAssetLibrary.load_asset(tool)
+        unreal_systems.EditorUtilitySubsystem.spawn_and_register_tab(asset)
 
 def launch_editor_utility_widget(asset):
     """
@@ -138,11 +151,11 @@ def launch_editor_utility_widget(asset):
 
     # Load the editor utility widget if an asset path was provided to the function
     if isinstance(asset, str):
-        if EditorAssetLibrary.does_asset_exist(asset):
-            asset = EditorAssetLibrary.load_asset(asset)
+        if unreal_systems.EditorAssetLibrary.does_asset_exist(asset):
+            asset = unreal_systems.EditorAssetLibrary.load_asset(asset)
         else:
             unreal.log_error(f"The given Editor Utility Widget path does not exist: {asset}")
             return
 
     # launch the editor utility widget and cache it
-    EditorUtilitySubsystem.spawn_and_register_tab(asset)
+    unreal_systems.EditorUtilitySubsystem.spawn_and_register_tab(asset)
@@ -2,18 +2,18 @@
 This module provides examples for handling Unreal Engine versions and discovering Python API changes
 """
 
-from functools import total_ordering
 import json
 from pathlib import Path
 
 import unreal
 
+from . import utils
+
 
 PYTHON_DATA_DIR = Path(unreal.SystemLibrary.get_platform_user_dir()) / "unreal/engine_python_data/"
 PYTHON_DATA_DIR.mkdir(exist_ok=True)
 
 
-@total_ordering
 class EngineVersion:
     """
     Utility class to compare Unreal Versions
@@ -38,11 +38,27 @@ class EngineVersion:
         # Store the version data
         version_ids = [int(i) for i in version_ids]
         version_ids.extend([0, 0])
-        self.major, self.minor, self.patch = version_ids[0:3]
+        # tuples of ints compare in c, this is the key used by all comparisons
+        self._key = tuple(version_ids[0:3])
+
+    @property
+    def major(self) -> int:
+        """The major version number"""
+        return self._key[0]
+
+    @property
+    def minor(self) -> int:
+        """The minor version number"""
+        return self._key[1]
+
+    @property
+    def patch(self) -> int:
+        """The patch version number"""
+        return self._key[2]
 
     @property
     def value(self) -> int:
-        """The numeric value of the engine version (used for comparison)"""
+        """The numeric value of the engine version"""
         return self.major*1000000 + self.minor*1000 + self.patch
 
     @property
@@ -50,19 +66,35 @@ class EngineVersion:
         """The string value of the engine version (human readable)"""
         return f"{self.major}.{self.minor}.{self.patch}"
 
-    # The @total_ordering decorator will use __lt__ and __eq__ to make
-    # the rest of our comparison functions
-    def __lt__(self, other: 'EngineVersion') -> bool:
+    @staticmethod
+    def _check(other):
+        """Raise a ValueError if the other object can't be compared to an EngineVersion"""
         if not isinstance(other, EngineVersion):
             raise ValueError(f"{other} must be of type EngineVersion!")
 
-        return self.value < other.value
+    # every comparison is made on the version tuple key
+    def __lt__(self, other: 'EngineVersion') -> bool:
+        self._check(other)
+        return self._key < other._key
+
+    def __le__(self, other: 'EngineVersion') -> bool:
+        self._check(other)
+        return self._key <= other._key
+
+    def __gt__(self, other: 'EngineVersion') -> bool:
+        self._check(other)
+        return self._key > other._key
+
+    def __ge__(self, other: 'EngineVersion') -> bool:
+        self._check(other)
+        return self._key >= other._key
 
     def __eq__(self, other) -> bool:
-        if not isinstance(other, EngineVersion):
-            raise ValueError(f"{other} must be of type EngineVersion!")
+        self._check(other)
+        return self._key == other._key
 
-        return self.value == other.value
+    def __hash__(self) -> int:
+        return hash(self._key)
 
     # repr to provide a cleaner debug printout ~ ex: EngineVersion("5.3.0")
     def __repr__(self) -> str:
@@ -103,8 +135,8 @@ def compare_unreal_python_versions(source_version: str, target_version: str = ""
         )
 
     # load the json data
-    source_data = json.loads(source_file.read_text())
-    target_data = json.loads(target_file.read_text())
+    source_data = utils.load_json(source_file)
+    target_data = utils.load_json(target_file)
 
     # collect all new properties/classes
     new_properties = {}
@@ -114,7 +146,8 @@ def compare_unreal_python_versions(source_version: str, target_version: str = ""
             new_properties[class_name] = properties
         # Otherwise, check each property to see which (if any) are new
         else:
-            added_properties = [p for p in properties if p not in source_data[class_name]]
+            source_properties = set(source_data[class_name])
+            added_properties = [p for p in properties if p not in source_properties]
             if added_properties:
                 new_properties[class_name] = added_properties
 
@@ -129,13 +162,17 @@ def collect_python_class_data():
     """
     current_version = EngineVersion().version.replace(".", "_")
 
-    class_data = {}
-    for class_name in sorted(dir(unreal)):
-        class_obj = getattr(unreal, class_name)
-        properties = [i for i in dir(class_obj) if not i.endswith("__")]
-        if properties:
-            class_data[class_name] = sorted(properties)
-
+    # stream each class to the file as it's collected rather than
+    # building the full dict of the Python API in memory first
     data_file = PYTHON_DATA_DIR / f"{current_version}.json"
-    with data_file.open("w", encoding="utf-8") as f:
-        json.dump(class_data, f, indent=2)
+    with data_file.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("{")
+        separator = "\n"
+        for class_name in sorted(dir(unreal)):
+            class_obj = getattr(unreal, class_name)
+            # skip the dunder attributes
+            properties = [i for i in dir(class_obj) if not (i.startswith("__") and i.endswith("__"))]
+            if properties:
+                f.write(f"{separator}  {json.dumps(class_name)}: {json.dumps(sorted(properties))}")
+                separator = ",\n"
+        f.write("\n}\n")
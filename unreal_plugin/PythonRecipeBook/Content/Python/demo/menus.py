@@ -10,9 +10,9 @@ import unreal
 
 from . import (
     actors,
-    editor_tools
+    editor_tools,
+    unreal_systems
 )
-from .unreal_systems import ToolMenus
 
 
 # ---------      Demo base class setups     --------- #
@@ -33,14 +33,11 @@ class PythonMenuTool(unreal.ToolMenuEntryScript):
 
         parameters:
             menu: the menu object to add this tool to
-            section: the section to group this tool under
+            section: the section to group this tool under, it must already be added to the menu
             insert_policy: if provided, how to add this entry to the parent menu
         """
         super().__init__()
 
-        # Add the given section if not already present
-        menu.add_section(section, section)
-
         # Initialize the entry data
         self.init_entry(
             owner_name="demo_tools_tracker",
@@ -108,7 +105,9 @@ class ActorHierarchy(PythonMenuTool):
         """
         print the current scene's actor hierarchy in a json format
         """
-        print(json.dumps(actors.get_scene_hierarchy(), indent=4))
+        # use compact separators, indenting a large level's hierarchy
+        # roughly doubles the output size and the time spent formatting it
+        print(json.dumps(actors.get_scene_hierarchy(), separators=(",", ":")))
 
 
 @unreal.uclass()
@@ -143,51 +142,56 @@ class MetadataFilterTool(EditorUtilMenuTool):
 # ---------      Create the menu     --------- #
 
 
-def populate_menus():
-    """
-    call this menu during unreal startup to populate our desired menus
-    we'll use separate functions to keep track of which menus we're extending
-    """
-    populate_main_menu()
-    populate_edit_menu()
-
-
-def populate_main_menu():
-    """
-    populate our demo dropdown menu on the main menu bar
-    """
-    # The main menu we'll add our tools to:
-    main_menu = ToolMenus.find_menu("LevelEditor.MainMenu")
-
-    # First, let's create a new sub menu:
-    demo_menu = main_menu.add_sub_menu(
-        owner="demo_tools_tracker",
-        section_name="",
-        name="demo_tools",
-        label="Demo Tools"
-    )
-
-    # Next, initialize our menu classes into the demo_menu in the desired sections
-    # these menu entries will be added in sequential order (no insert policy provided)
-    section = "scene"
-    ActorHierarchy(menu=demo_menu, section=section)
-    TrackActors(menu=demo_menu, section=section)
-
-    section = "tools"
-    MetadataFilterTool(menu=demo_menu, section=section)
+# each menu we extend, the tools are added in sequential order within each section:
+#     (menu path, sub menu (name, label) or None, insert policy (entry name, insert type) or None,
+#      [(section, [tool classes]), ...])
+MENU_SPEC = [
+    # populate our demo dropdown menu on the main menu bar
+    (
+        "LevelEditor.MainMenu", ("demo_tools", "Demo Tools"), None,
+        [
+            ("scene", [ActorHierarchy, TrackActors]),
+            ("tools", [MetadataFilterTool]),
+        ]
+    ),
+    # insert our entry class to the Edit menu after the `Paste` option
+    (
+        "LevelEditor.MainMenu.Edit", None, ("Paste", unreal.ToolMenuInsertType.AFTER),
+        [
+            ("EditMain", [Huzzah]),
+        ]
+    ),
+]
 
 
-def populate_edit_menu():
+def populate_menus():
     """
-    insert our entry class to the Edit menu after the `Paste` option
+    call this menu during unreal startup to populate our desired menus
+    the menus we're extending and the tools to add are declared in MENU_SPEC
     """
-    # The edit menu we'll add our tools to:
-    edit_menu = ToolMenus.find_menu("LevelEditor.MainMenu.Edit")
-
-    # First, we'll create our insert policy: after the menu entry named "Paste"
-    insert_policy = unreal.ToolMenuInsert("Paste", unreal.ToolMenuInsertType.AFTER)
+    for menu_path, sub_menu, insert_data, sections in MENU_SPEC:
+        # The menu we'll add our tools to:
+        menu = unreal_systems.ToolMenus.find_menu(menu_path)
+
+        # create a new sub menu if requested:
+        if sub_menu:
+            sub_menu_name, sub_menu_label = sub_menu
+            menu = menu.add_sub_menu(
+                owner="demo_tools_tracker",
+                section_name="",
+                name=sub_menu_name,
+                label=sub_menu_label
+            )
 
-    # Next, initialize our menu classes into the edit_menu in the desired section
-    # this menu entry will be added after the Paste entry (insert policy provided)
-    section = "EditMain"
-    Huzzah(menu=edit_menu, section=section, insert_policy=insert_policy)
+        # create our insert policy if requested, such as after the menu entry named "Paste"
+        insert_policy = None
+        if insert_data:
+            insert_policy = unreal.ToolMenuInsert(*insert_data)
+
+        # Next, initialize our menu classes into the menu in the desired sections
+        # without an insert policy these menu entries will be added in sequential order
+        for section, tools in sections:
+            # Add the section once for all of its tools
+            menu.add_section(section, section)
+            for tool in tools:
+                tool(menu=menu, section=section, insert_policy=insert_policy)
@@ -11,13 +11,11 @@ PRE-REQUISITE:
     Plugins can also deliver metadata in the `Config/Default<plugin_name>.ini` file
 """
 
+from operator import attrgetter
 import sys
 import unreal
-from .unreal_systems import (
-    asset_registry_helper,
-    asset_registry,
-    EditorAssetLibrary
-)
+
+from . import unreal_systems
 
 
 # Arbitrary metadata example: let's pretend we're tracking assets!
@@ -31,16 +29,52 @@ META_ASSET_NAME       = "asset_name"     # the official name of our asset
 META_ASSET_AUTHOR     = "asset_author"   # who's the creator of this asset?
 META_ASSET_VERSION    = "asset_version"  # what version number is this asset currently set to?
 
+# the metadata keys to register to the Asset Registry
+METADATA_KEYS = (
+    META_IS_MANAGED_ASSET,
+    META_ASSET_TYPE,
+    META_ASSET_GROUP,
+    META_ASSET_NAME,
+    META_ASSET_AUTHOR,
+    META_ASSET_VERSION
+)
+
+
+def str_to_bool(value):
+    """convert a metadata string to a bool, bool(str) only checks for length"""
+    return value.lower() == "true"
+
 
 # Unreal stores metadata as strings
-# this dict maps metadata names we want to be non-strings
+# this dict maps metadata names we want to be non-strings to their conversion function
 # we can use this to get metadata as their expected type (such as an int or bool)
 METADATA_TYPE_MAP = {
-    META_IS_MANAGED_ASSET: bool,
+    META_IS_MANAGED_ASSET: str_to_bool,
     META_ASSET_VERSION: int
 }
 
 
+# bools are the most common metadata search values, skip converting them with str()
+BOOL_STRINGS = {True: "True", False: "False"}
+
+
+def get_package_name(asset):
+    """
+    Get the package name of a loaded unreal.Object reference OR unreal.AssetData
+
+    parameters:
+        asset: the asset to process
+
+    Return:
+        the asset's package name, such as "/Game/folder/asset"
+    """
+    if isinstance(asset, unreal.AssetData):
+        return str(asset.package_name)
+
+    # an object path is formatted as "<package name>.<object name>"
+    return asset.get_path_name().split(".", 1)[0]
+
+
 def set_metadata(asset, key, value):
     """
     Setting Metadata is done on a loaded unreal.Object reference
@@ -50,7 +84,7 @@ def set_metadata(asset, key, value):
         key:   the metadata key name
         value: the metadata value
     """
-    EditorAssetLibrary.set_metadata_tag(asset, key, str(value))
+    unreal_systems.EditorAssetLibrary.set_metadata_tag(asset, key, str(value))
 
 
 def get_metadata(asset, key, default=None):
@@ -72,22 +106,70 @@ def get_metadata(asset, key, default=None):
     if isinstance(asset, unreal.AssetData):
         value = asset.get_tag_value(key)
     else:
-        value = EditorAssetLibrary.get_metadata_tag(asset, key)
+        value = unreal_systems.EditorAssetLibrary.get_metadata_tag(asset, key)
 
-    if value and value.lower != "none":
-        # Get this metadata key's expected value type:
-        value_type = METADATA_TYPE_MAP.get(key, str)
+    return convert_metadata_value(key, value, default)
 
-        if value_type == bool:
-            # bools are a special case as bool(str) only checks for length
-            return value.lower() == "true"
-        else:
-            # most value types may be directly converted
-            return value_type(value)
+
+def convert_metadata_value(key, value, default=None):
+    """
+    Convert a metadata string value to its expected type using METADATA_TYPE_MAP
+
+    parameters:
+        key:   the metadata key name
+        value: the metadata string value
+        default: the default value to assume if the metadata is not set
+
+    Return:
+        the metadata value in its expected type (if mapped in METADATA_TYPE_MAP)
+    """
+    if value and value.lower() != "none":
+        # Convert the value using this metadata key's conversion function
+        return METADATA_TYPE_MAP.get(key, str)(value)
 
     return default
 
 
+def get_metadata_bulk(assets, keys, default=None):
+    """
+    Get multiple metadata values from multiple assets
+
+    Each asset's metadata is read from unreal in a single call rather than once per key,
+    this is much faster when displaying several metadata values for many assets
+
+    parameters:
+        assets: a list of loaded unreal.Object references and/or unreal.AssetData
+        keys:   the metadata key names to get
+        default: the default value to assume if the metadata is not set
+
+    Return:
+        dict of {package name: {metadata key: value}} with each value in its expected type
+    """
+    # this custom c++ function gets all of an AssetData's tags in one call,
+    # plugin binaries built before it was added won't have it so we'll fall back to one call per key
+    get_asset_tag_values = getattr(unreal.PythonUtilsLibrary, "get_asset_tag_values", None)
+
+    data = {}
+    for asset in assets:
+        package_name = get_package_name(asset)
+
+        # get all of the asset's metadata in one call where possible
+        if not isinstance(asset, unreal.AssetData):
+            tag_values = unreal_systems.EditorAssetLibrary.get_metadata_tag_values(asset)
+        elif get_asset_tag_values:
+            tag_values = get_asset_tag_values(asset)
+        else:
+            tag_values = {key: asset.get_tag_value(key) for key in keys}
+
+        tag_values = {str(tag): value for tag, value in tag_values.items()}
+        data[package_name] = {
+            key: convert_metadata_value(key, tag_values.get(key, ""), default)
+            for key in keys
+        }
+
+    return data
+
+
 def find_assets_by_metadata(metadata=None, class_names=None):
     """
     Find assets in our project's Content Browser
@@ -103,31 +185,46 @@ def find_assets_by_metadata(metadata=None, class_names=None):
     if metadata is None:
         metadata = {META_IS_MANAGED_ASSET: True}
 
-    if class_names is None:
-        class_names = ["object"]
+    # Convert the key:value pairs to metadata queries,
+    # the value strings are interned so repeated searches reuse the same string objects
+    queries = [
+        unreal.TagAndValue(key, BOOL_STRINGS[value] if isinstance(value, bool) else sys.intern(str(value)))
+        for key, value in metadata.items()
+    ]
 
     # create a basic Asset Registry filter:
-    base_filter = unreal.ARFilter(
-        class_names=class_names,
-        recursive_classes=True
-    )
+    # the Asset Registry won't search with an empty filter, so when there's no metadata
+    # to search by and no class names were given we'll fall back to all objects
+    if class_names is None and not queries:
+        class_names = ["object"]
 
-    # get the initial search results using the base filter:
-    results = asset_registry.get_assets(base_filter) or []
+    if class_names:
+        base_filter = unreal.ARFilter(
+            class_names=class_names,
+            recursive_classes=True
+        )
+    else:
+        base_filter = unreal.ARFilter()
 
-    # filter the results to only those matching the given metadata key:value pairs
-    for key, value in metadata.items():
-        # Convert the key:value pair and create a metadata based filter:
-        query = unreal.TagAndValue(key, str(value))
-        meta_filter = asset_registry_helper.set_filter_tags_and_values(base_filter, [query])
+    # the Asset Registry treats multiple tag/value pairs in a single filter as an OR,
+    # so we'll search with the first query and reduce the results with the rest
+    if queries:
+        meta_filter = unreal_systems.asset_registry_helper.set_filter_tags_and_values(base_filter, queries[:1])
+        results = unreal_systems.asset_registry.get_assets(meta_filter) or []
+    else:
+        results = unreal_systems.asset_registry.get_assets(base_filter) or []
 
-        # reduce the results to only those matching the given metadata
-        results = asset_registry.run_assets_through_filter(results, meta_filter) or []
+    # filter the results to only those matching the remaining metadata key:value pairs
+    for query in queries[1:]:
         if not results:
             break
 
+        # reduce the results to only those matching the given metadata
+        meta_filter = unreal_systems.asset_registry_helper.set_filter_tags_and_values(base_filter, [query])
+        results = unreal_systems.asset_registry.run_assets_through_filter(results, meta_filter) or []
+
     # return the results as a sorted Python list
-    return [i for i in sorted(results, key=lambda x: x.package_name)]
+    return sorted(results, key=attrgetter("package_name"))
 
 
 
@@ -140,15 +237,5 @@ def metadata_startup():
     more reliable in my experience when making tools. It also allows us to set the metadata
     from the same code
     """
-    # the metadata keys to register to the Asset Registry
-    metadata_keys = [
-        META_IS_MANAGED_ASSET,
-        META_ASSET_TYPE,
-        META_ASSET_GROUP,
-        META_ASSET_NAME,
-        META_ASSET_AUTHOR,
-        META_ASSET_VERSION
-    ]
-
     # this custom c++ function exposes the ability to add metadata keys directly to the Asset Registry
-    unreal.PythonUtilsLibrary.register_metadata_tags(metadata_keys)
+    unreal.PythonUtilsLibrary.register_metadata_tags(METADATA_KEYS)
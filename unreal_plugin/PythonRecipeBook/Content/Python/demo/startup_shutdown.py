@@ -15,15 +15,35 @@ from . import (
     menus,
     metadata,
     bp_library,
-    editor_tools
+    editor_tools,
+    unreal_systems
 )
-from .unreal_systems import asset_registry
+
+
+# how often (in seconds) to check if the asset registry has finished loading
+ASSET_REGISTRY_CHECK_INTERVAL = 1.0
+
+
+class StartupState:
+    """
+    Tracks the startup progress and callback IDs of this module
+
+    using a single module level instance we can prevent any duplicate work from happening,
+    __slots__ keeps attribute access fast as it's checked on every Slate tick during startup
+    """
+    __slots__ = ("has_run", "post_startup_id", "shutdown_id", "time_since_check")
+
+    def __init__(self):
+        self.has_run = False
+        self.post_startup_id = None
+        self.shutdown_id = None
+
+        # start at the interval so the first tick checks the asset registry right away
+        self.time_since_check = ASSET_REGISTRY_CHECK_INTERVAL
 
 
 # This module will make use of callbacks to handle two of its steps
-# using a module variable cache we can prevent any duplicate work from happening
-post_startup_id = None
-shutdown_id = None
+state = StartupState()
 
 
 def pre_startup():
@@ -34,7 +54,7 @@ def pre_startup():
     It is safe to extend menus, initialized Python-based Blueprint Function Libraries,
     as well as anything not dependent on assets / files within the Content Browser
     """
-    print(f"running pre startup, is asset registry available? {not asset_registry.is_loading_assets()}")
+    print(f"running pre startup, is asset registry available? {not unreal_systems.asset_registry.is_loading_assets()}")
     bp_library.PyDemoBPLibrary()
     menus.populate_menus()
     metadata.metadata_startup()
@@ -46,7 +66,7 @@ def post_startup():
 
     It should be safe to run any Python logic within Unreal at this point
     """
-    print(f"running post startup, is asset registry available? {not asset_registry.is_loading_assets()}")
+    print(f"running post startup, is asset registry available? {not unreal_systems.asset_registry.is_loading_assets()}")
     editor_tools.startup()
 
     # Track the actor selection changes in the 3D level
@@ -70,36 +90,47 @@ def run():
     call this function from init_unreal to handle the Python startup process
     """
     # Ensure startup only run once
-    global post_startup_id
-    if post_startup_id:
+    if state.has_run:
         print("Package has already been initialized!")
         return
+    state.has_run = True
 
     # register and cache the post_startup callback and then run pre_startup
-    post_startup_id = unreal.register_slate_post_tick_callback(asset_registry_callback)
+    state.post_startup_id = unreal.register_slate_post_tick_callback(asset_registry_callback)
     pre_startup()
 
 
-def asset_registry_callback(ignore=None):
+def asset_registry_callback(delta_time=0.0):
     """
     call post_startup() once the Asset Registry is fully loaded
     This function handles the cache and will also set up the shutdown callback
+
+    This runs on every Slate tick, the asset registry is only checked once per
+    ASSET_REGISTRY_CHECK_INTERVAL as large projects may take minutes to finish loading
     """
+    # skip if post startup has already been handled
+    if state.post_startup_id is None:
+        return
+
+    # only check the asset registry once per interval
+    state.time_since_check += delta_time
+    if state.time_since_check < ASSET_REGISTRY_CHECK_INTERVAL:
+        return
+    state.time_since_check = 0.0
+
     # check the asset registry
-    if asset_registry.is_loading_assets():
+    if unreal_systems.asset_registry.is_loading_assets():
         print("Asset Registry scan is still in progress...")
         return
 
     # unregister the callback
-    global post_startup_id
-    if post_startup_id:
-        unreal.unregister_slate_post_tick_callback(post_startup_id)
+    unreal.unregister_slate_post_tick_callback(state.post_startup_id)
+    state.post_startup_id = None
 
     # run post startup
     post_startup()
 
     # register and cache the shutdown callback
     print("Registering Python Shutdown callback: startup_shutdown.shutdown()")
-    global shutdown_id
-    if not shutdown_id:
-        shutdown_id = unreal.register_python_shutdown_callback(shutdown)
+    if state.shutdown_id is None:
+        state.shutdown_id = unreal.register_python_shutdown_callback(shutdown)
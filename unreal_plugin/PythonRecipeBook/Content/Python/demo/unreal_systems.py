@@ -3,21 +3,47 @@ This is more of a personal preference, I found myself constantly
 getting the same systems and library classes so I decided to make
 a module for them. This by no means every library or system,
 just a few to give the idea
+
+The systems are only initialized the first time they're used rather than on import,
+some of them may not be ready yet when Python is first initialized during Unreal startup
 """
 
 
 import unreal
 
 
-# Registries and Libraries
-asset_registry_helper = unreal.AssetRegistryHelpers()
-asset_registry        = asset_registry_helper.get_asset_registry()
-EditorAssetLibrary    = unreal.EditorAssetLibrary()
-ToolMenus             = unreal.ToolMenus.get()
-AssetTools            = unreal.AssetToolsHelpers.get_asset_tools()
+# the functions used to get each system, the results are stored on the module once resolved
+system_getters = {
+    # Registries and Libraries
+    "asset_registry_helper":  lambda: unreal.AssetRegistryHelpers(),
+    "asset_registry":         lambda: unreal.AssetRegistryHelpers.get_asset_registry(),
+    "EditorAssetLibrary":     lambda: unreal.EditorAssetLibrary(),
+    "ToolMenus":              lambda: unreal.ToolMenus.get(),
+    "AssetTools":             lambda: unreal.AssetToolsHelpers.get_asset_tools(),
+
+    # Subsystems
+    "AssetEditorSubsystem":   lambda: unreal.get_editor_subsystem(unreal.AssetEditorSubsystem),
+    "EditorActorSubsystem":   lambda: unreal.get_editor_subsystem(unreal.EditorActorSubsystem),
+    "EditorUtilitySubsystem": lambda: unreal.get_editor_subsystem(unreal.EditorUtilitySubsystem),
+    "LevelEditorSubsystem":   lambda: unreal.get_editor_subsystem(unreal.LevelEditorSubsystem),
+}
+
+
+def __getattr__(name):
+    """
+    Python calls this when the requested module attribute doesn't exist yet (PEP 562)
+
+    The system is resolved and stored on the module,
+    any later use will find it directly without calling this again
+    """
+    getter = system_getters.get(name)
+    if getter is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    system = getter()
+    globals()[name] = system
+    return system
+
 
-# Subsystems
-AssetEditorSubsystem   = unreal.get_editor_subsystem(unreal.AssetEditorSubsystem)
-EditorActorSubsystem   = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-EditorUtilitySubsystem = unreal.get_editor_subsystem(unreal.EditorUtilitySubsystem)
-LevelEditorSubsystem   = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
+def __dir__():
+    return sorted(set(globals()) | set(system_getters))
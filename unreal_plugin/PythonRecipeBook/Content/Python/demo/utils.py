@@ -3,14 +3,40 @@ This module is meant for miscellaneous utilities that I found useful
 """
 
 
+from functools import lru_cache
+import json
+from pathlib import Path
+
 import unreal
 
-from .unreal_systems import EditorAssetLibrary
+from . import unreal_systems
+
+# orjson is a much faster json library, it isn't included with Unreal's Python
+# so we'll use it when it's been installed and fall back to the json module otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# module caches to store path information
+# this will save us from repeatedly querying unreal for data
+pytemp_dir = None
+
+def get_pytemp_dir():
+    """
+    The directory we save our temp files to,
+    it should resolve to "{project dir}/Saved/pytemp"
+
+    The path doesn't change during the editor session so it's only resolved once
+    """
+    global pytemp_dir
+
+    if pytemp_dir is None:
+        pytemp_dir = Path(unreal.Paths.project_saved_dir(), "pytemp")
 
+    return pytemp_dir
 
-# module caches to store asset / class information
-# this will save us from repeatedly searching for or loading unreal data
-asset_class_cache = {}
 
 def new_instance_from_asset(asset):
     """
@@ -27,22 +53,68 @@ def new_instance_from_asset(asset):
     Return:
         a new Python instance of the asset's class
     """
-    global asset_class_cache
-
-    # Check if the asset is already cached
     asset_path = asset if isinstance(asset, str) else asset.get_path_name()
-    if not asset_class_cache.get(asset_path):
+    try:
+        asset_class = get_asset_class(asset_path)
+    except ValueError as e:
+        unreal.log_error(str(e))
+        return
 
-        # Load the asset if an asset path was provided to the function
-        if isinstance(asset, str):
-            if EditorAssetLibrary.does_asset_exist(asset):
-                asset = EditorAssetLibrary.load_asset(asset)
-            else:
-                unreal.log_error(f"The given asset path does not exist: {asset}")
-                return
+    # return a new instance of the asset's class:
+    return unreal.new_object(asset_class)
 
-        # cache the loaded asset's generated class:
-        asset_class_cache[asset_path] = asset.generated_class()
 
-    # return a new instance of the asset's class:
-    return unreal.new_object(asset_class_cache[asset_path])
+@lru_cache(maxsize=256)
+def get_asset_class(asset_path):
+    """
+    Get the generated class of the given asset path
+
+    The results are cached, the cache is bounded so that long editor sessions
+    loading many transient assets won't grow it indefinitely
+
+    parameters:
+        asset_path: the string asset_path of a Blueprint asset
+
+    Return:
+        the asset's generated class
+
+    Raises:
+        ValueError: the asset path does not exist (this result won't be cached)
+    """
+    if not unreal_systems.EditorAssetLibrary.does_asset_exist(asset_path):
+        raise ValueError(f"The given asset path does not exist: {asset_path}")
+
+    return unreal_systems.EditorAssetLibrary.load_asset(asset_path).generated_class()
+
+
+def save_json(json_file, data):
+    """
+    Write the given data to a json file using orjson if available
+
+    parameters:
+        json_file: the pathlib.Path of the json file to write
+        data: the json compliant data to save
+    """
+    # both libraries write the encoded utf-8 bytes in a single call,
+    # json.dump() would instead send each small chunk through the text encoder
+    if orjson:
+        json_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        json_file.write_bytes(json.dumps(data, indent=2).encode("utf-8"))
+
+
+def load_json(json_file):
+    """
+    Read the given json file using orjson if available
+
+    parameters:
+        json_file: the pathlib.Path of the json file to read
+
+    Return:
+        the json file's data
+    """
+    if orjson:
+        return orjson.loads(json_file.read_bytes())
+
+    with json_file.open("rb") as f:
+        return json.load(f)
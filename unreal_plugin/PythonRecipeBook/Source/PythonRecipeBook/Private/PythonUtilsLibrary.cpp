@@ -53,4 +53,15 @@ UPythonUtilsLibrary::RegisterMetadataTags(const TArray<FName>& Tags)
 	}
 }
 
+TMap<FName, FString>
+UPythonUtilsLibrary::GetAssetTagValues(const FAssetData& AssetData)
+{
+	TMap<FName, FString> Ret;
+	AssetData.EnumerateTags([&Ret](const TPair<FName, FAssetTagValueRef>& Tag)
+	{
+		Ret.Add(Tag.Key, Tag.Value.AsString());
+	});
+	return Ret;
+}
+
 #undef LOCTEXT_NAMESPACE
\ No newline at end of file
@@ -1,6 +1,7 @@
 #pragma once
 
 #include "Kismet/BlueprintFunctionLibrary.h"
+#include "AssetRegistry/AssetData.h"
 #include "EditorUtilityWidgetBlueprint.h"
 
 #include "PythonUtilsLibrary.generated.h"
@@ -40,4 +41,12 @@ public:
      */
     UFUNCTION(BlueprintCallable, Category = "Python | Utils")
     static void RegisterMetadataTags(const TArray<FName>& Tags);
+
+    /**  Get all of the metadata tags & values stored on the given Asset Data
+     * @param  AssetData  the Asset Data to query the tags from
+     *
+     * @return  a map of the asset's tag names and their string values
+     */
+    UFUNCTION(BlueprintCallable, Category = "Python | Utils")
+    static TMap<FName, FString> GetAssetTagValues(const FAssetData& AssetData);
 };
\ No newline at end of file